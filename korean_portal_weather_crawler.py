@@ -8,22 +8,27 @@ This project is for educational and portfolio purposes only and is
 not affiliated with or endorsed by Naver Corporation.
 """
 
+from __future__ import annotations
+
 import argparse
+import atexit
 import logging
-from dataclasses import dataclass, asdict
-from typing import Dict, Optional
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
-from selenium import webdriver
-from selenium.common.exceptions import (
-    TimeoutException,
-    WebDriverException,
-)
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
-from webdriver_manager.chrome import ChromeDriverManager
+# Selenium is imported lazily inside the functions that need it, so
+# importing this module (e.g. for WeatherData) stays cheap.
+if TYPE_CHECKING:
+    from selenium import webdriver
+    from selenium.webdriver.remote.webelement import WebElement
 
 # ---------------------------------------------------------------------------
 # Logging configuration
@@ -41,8 +46,10 @@ def configure_logging(level: int = logging.INFO) -> None:
         return
 
     logger.setLevel(level)
+    # %(created) is the raw epoch timestamp, which avoids the per-record
+    # time.strftime call that %(asctime) needs.
     formatter = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(name)s - %(message)s"
+        "%(created).3f [%(levelname)s] %(name)s - %(message)s"
     )
 
     console_handler = logging.StreamHandler()
@@ -55,7 +62,7 @@ logger = logging.getLogger(__name__)
 # Data model
 # ---------------------------------------------------------------------------
 
-@dataclass
+@dataclass(frozen=True)
 class WeatherData:
     """
     Data model for scraped weather information.
@@ -66,24 +73,155 @@ class WeatherData:
         status: Weather description (e.g. sunny, cloudy).
     """
 
+    # Declared by hand rather than with dataclass(slots=True), which
+    # needs Python 3.10+.
+    __slots__ = ("location", "temperature", "status")
+
     location: Optional[str]
     temperature: Optional[str]
     status: Optional[str]
 
+    # Frozen + __slots__ has no __dict__ to restore into, so copy and
+    # pickle need explicit state handling (as dataclass(slots=True)
+    # generates on 3.10+).
+    def __getstate__(self) -> Tuple[Optional[str], ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Optional[str], ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
     def to_dict(self) -> Dict[str, Optional[str]]:
         """Return weather data as a plain dictionary."""
-        return asdict(self)
+        return {
+            "location": self.location,
+            "temperature": self.temperature,
+            "status": self.status,
+        }
+
+
+# (field_name, css_selector) for each WeatherData field, in field order.
+# The first field is waited for before the page is read.
+#
+# NOTE:
+# These CSS selectors may change if the portal updates its layout.
+# In that case, you only need to adjust the selectors below.
+FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("location", "strong.location_name, span.location_name"),
+    ("temperature", ".card_data_now .card_now_temperature"),
+    ("status", ".card_data_detail .card_date_emphasis"),
+)
+
+# A selector that is only a descendant chain of single classes
+# (".a .b .c") can be resolved with nested getElementsByClassName calls,
+# which skips the compound CSS selector matcher.
+_CLASS_CHAIN_RE = re.compile(r"\.[\w-]+(?:\s+\.[\w-]+)*")
+
+
+def _class_path(selector: str) -> List[str]:
+    """
+    Derive the getElementsByClassName path equivalent to `selector`.
+
+    Args:
+        selector: CSS selector from FIELDS.
+
+    Returns:
+        Class names (outermost first), or an empty list when the
+        selector is not a plain class chain and must be run as CSS.
+    """
+    selector = selector.strip()
+    if not _CLASS_CHAIN_RE.fullmatch(selector):
+        return []
+    return [part[1:] for part in selector.split()]
+
+
+# Same value as selenium's By.CSS_SELECTOR, spelled out so the locators
+# below can be built without importing selenium.
+_CSS_SELECTOR = "css selector"
+
+# Selenium locators for each field, built once.
+_FIELD_LOCATORS: List[Tuple[str, str]] = [
+    (_CSS_SELECTOR, selector) for _, selector in FIELDS
+]
+
+# Lookup payload for the batched lookup scripts, built once.
+_FIELD_LOOKUPS: List[List[object]] = [
+    [selector, _class_path(selector)] for _, selector in FIELDS
+]
 
 # ---------------------------------------------------------------------------
 # WebDriver factory
 # ---------------------------------------------------------------------------
 
-def create_driver(headless: bool = True) -> webdriver.Chrome:
+DEFAULT_WINDOW_SIZE = "1280,720"
+
+# "eager" returns from driver.get() at DOMContentLoaded instead of waiting
+# for every subresource; "none" returns before the new document is even
+# committed and relies on the explicit element wait in
+# _scrape_with_driver. In "none" mode reused drivers are parked on
+# about:blank after each run, so that wait cannot see the previous
+# page's elements.
+DEFAULT_PAGE_LOAD_STRATEGY = "eager"
+
+# URL patterns blocked via CDP; only the text nodes are scraped, so images,
+# fonts, media, stylesheets and trackers are unnecessary downloads.
+BLOCKED_URL_PATTERNS = [
+    "*.png",
+    "*.jpg",
+    "*.jpeg",
+    "*.gif",
+    "*.webp",
+    "*.svg",
+    "*.woff*",
+    "*.ttf",
+    "*.mp4",
+    "*.css",
+    "*doubleclick*",
+    "*googletagmanager*",
+    "*google-analytics*",
+]
+
+# Pooled drivers keyed by (headless, window_size, page_load_strategy).
+_DRIVER_POOL: Dict[Tuple[bool, str, str], webdriver.Chrome] = {}
+
+# Guards _DRIVER_POOL. scrape_weather also holds it for the whole page
+# visit, because one browser can only show one page at a time; use
+# run_crawler_many for parallel crawls.
+_POOL_LOCK = threading.RLock()
+
+
+@lru_cache(maxsize=None)
+def _get_driver_path() -> Optional[str]:
+    """
+    Resolve an explicit chromedriver executable path once and cache it.
+
+    A `CHROMEDRIVER_PATH` environment variable or a `chromedriver` on
+    $PATH is used as-is. When neither exists, None is returned and
+    Selenium's built-in Selenium Manager (Selenium 4.6+) locates or
+    downloads a matching driver.
+
+    Returns:
+        Path to the chromedriver executable, or None.
+    """
+    path = os.environ.get("CHROMEDRIVER_PATH") or shutil.which(
+        "chromedriver"
+    )
+    logger.debug("Using chromedriver at %s", path or "<Selenium Manager>")
+    return path
+
+
+def create_driver(
+    headless: bool = True,
+    window_size: str = DEFAULT_WINDOW_SIZE,
+    page_load_strategy: str = DEFAULT_PAGE_LOAD_STRATEGY,
+) -> webdriver.Chrome:
     """
     Create and configure a Chrome WebDriver instance.
 
     Args:
         headless: If True, run Chrome in headless mode.
+        window_size: Browser window size as "width,height".
+        page_load_strategy: "normal", "eager" (default) or "none".
 
     Returns:
         A configured Chrome WebDriver instance.
@@ -91,66 +229,279 @@ def create_driver(headless: bool = True) -> webdriver.Chrome:
     Raises:
         WebDriverException: If Chrome WebDriver creation fails.
     """
+    from selenium import webdriver
+    from selenium.common.exceptions import WebDriverException
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+
     chrome_options = Options()
+    chrome_options.page_load_strategy = page_load_strategy
     if headless:
         chrome_options.add_argument("--headless=new")
 
     # Common options for more stable scraping environments
     chrome_options.add_argument("--disable-gpu")
     chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--window-size=1280,720")
+    chrome_options.add_argument(f"--window-size={window_size}")
     chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-logging")
+    chrome_options.add_argument("--log-level=3")
+
+    # Skip browser services and image decoding that scraping text never needs
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-background-networking")
+    chrome_options.add_argument("--disable-sync")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-translate")
+    chrome_options.add_argument("--blink-settings=imagesEnabled=false")
     chrome_options.add_experimental_option(
-        "excludeSwitches", ["enable-logging"]
+        "prefs", {"profile.managed_default_content_settings.images": 2}
     )
 
-    service = Service(ChromeDriverManager().install())
+    # Without an explicit path, let Selenium Manager resolve the driver.
+    # Service(None) only works on Selenium 4.11+, so omit it instead.
+    driver_path = _get_driver_path()
 
     try:
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        if driver_path:
+            driver = webdriver.Chrome(
+                service=Service(executable_path=driver_path),
+                options=chrome_options,
+            )
+        else:
+            driver = webdriver.Chrome(options=chrome_options)
+        _block_resources(driver)
         logger.info("Chrome WebDriver created (headless=%s)", headless)
         return driver
     except WebDriverException as e:
         logger.exception("Failed to create Chrome WebDriver: %s", e)
         raise
 
+
+def _block_resources(driver: webdriver.Chrome) -> None:
+    """
+    Block non-essential resources (see BLOCKED_URL_PATTERNS) via CDP.
+
+    Failures are logged and ignored so scraping still works on drivers
+    without CDP support.
+
+    Args:
+        driver: Selenium WebDriver instance.
+    """
+    from selenium.common.exceptions import WebDriverException
+
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd(
+            "Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS}
+        )
+        driver.execute_cdp_cmd(
+            "Network.setCacheDisabled", {"cacheDisabled": False}
+        )
+    except WebDriverException as e:
+        logger.warning("Failed to block resources via CDP: %s", e)
+
+
+def get_driver(
+    headless: bool = True,
+    window_size: str = DEFAULT_WINDOW_SIZE,
+    page_load_strategy: str = DEFAULT_PAGE_LOAD_STRATEGY,
+) -> webdriver.Chrome:
+    """
+    Return a pooled Chrome WebDriver, creating it on first use.
+
+    Reusing one browser across calls avoids paying the Chrome launch
+    cost for every scraped URL. Pooled drivers are closed at interpreter
+    exit (see `shutdown_pool`).
+
+    This function is thread-safe, but the returned driver is shared:
+    it must not be used by several threads at once. scrape_weather
+    serializes its page visits for this reason.
+
+    Args:
+        headless: If True, run Chrome in headless mode.
+        window_size: Browser window size as "width,height".
+        page_load_strategy: "normal", "eager" (default) or "none".
+
+    Returns:
+        A configured Chrome WebDriver instance.
+    """
+    key = (headless, window_size, page_load_strategy)
+    with _POOL_LOCK:
+        driver = _DRIVER_POOL.get(key)
+        if driver is None:
+            driver = create_driver(
+                headless=headless,
+                window_size=window_size,
+                page_load_strategy=page_load_strategy,
+            )
+            _DRIVER_POOL[key] = driver
+        return driver
+
+
+def _session_lost(driver: webdriver.Chrome, error: Exception) -> bool:
+    """
+    Tell whether `error` means the driver's browser session is gone.
+
+    Errors about the page itself (a bad URL, DNS or connection failures,
+    page-load timeouts) leave the session usable and return False.
+
+    Args:
+        driver: Selenium WebDriver instance the error came from.
+        error: Exception raised while using `driver`.
+
+    Returns:
+        True if the driver should be discarded.
+    """
+    from selenium.common.exceptions import (
+        InvalidSessionIdException,
+        NoSuchWindowException,
+    )
+
+    if isinstance(error, (InvalidSessionIdException, NoSuchWindowException)):
+        return True
+    try:
+        driver.current_url
+    except Exception:
+        return True
+    return False
+
+
+def _discard_driver(driver: webdriver.Chrome) -> None:
+    """
+    Remove a (presumably broken) driver from the pool and quit it.
+
+    Args:
+        driver: Pooled Selenium WebDriver instance.
+    """
+    with _POOL_LOCK:
+        for key, pooled in list(_DRIVER_POOL.items()):
+            if pooled is driver:
+                del _DRIVER_POOL[key]
+    try:
+        driver.quit()
+    except Exception as e:
+        logger.warning("Failed to quit discarded WebDriver: %s", e)
+
+
+def shutdown_pool() -> None:
+    """Quit every pooled WebDriver and empty the pool."""
+    with _POOL_LOCK:
+        while _DRIVER_POOL:
+            _, driver = _DRIVER_POOL.popitem()
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning("Failed to quit pooled WebDriver: %s", e)
+    logger.debug("WebDriver pool closed")
+
+
+atexit.register(shutdown_pool)
+
 # ---------------------------------------------------------------------------
 # Helper for safe element text extraction
 # ---------------------------------------------------------------------------
 
+def _normalize_text(text: Optional[str]) -> Optional[str]:
+    """
+    Collapse whitespace runs to single spaces and strip the ends.
+
+    Every backend passes its raw text through here, so that spacing is
+    consistent between browser (innerText) and static-HTML results. The
+    text itself still comes from different sources; see
+    _extract_from_html for how the static path can differ.
+
+    Args:
+        text: Raw element text, or None.
+
+    Returns:
+        Normalized text, or None if it is empty.
+    """
+    if not text:
+        return None
+    return " ".join(text.split()) or None
+
+
+# Poll delays for _wait_for_element: start small, grow geometrically, cap.
+_POLL_INITIAL = 0.01
+_POLL_FACTOR = 1.5
+_POLL_MAX = 0.5
+
+
+def _wait_for_element(
+    driver: webdriver.Chrome,
+    locator: Tuple[str, str],
+    timeout: float = 10,
+) -> WebElement:
+    """
+    Wait for an element with exponentially spaced polls.
+
+    Unlike WebDriverWait's fixed 0.5s interval, polling starts at
+    _POLL_INITIAL and grows up to _POLL_MAX, so elements that appear
+    quickly are returned almost immediately.
+
+    Args:
+        driver: Selenium WebDriver instance.
+        locator: (strategy, selector) pair, e.g. (By.CSS_SELECTOR, "...").
+        timeout: Maximum wait time in seconds.
+
+    Returns:
+        The first matching element.
+
+    Raises:
+        TimeoutException: If no element matches within `timeout`.
+    """
+    from selenium.common.exceptions import TimeoutException
+
+    deadline = time.monotonic() + timeout
+    delay = _POLL_INITIAL
+    while True:
+        elems = driver.find_elements(*locator)
+        if elems:
+            return elems[0]
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutException(
+                f"No element found for {locator[0]}='{locator[1]}' "
+                f"within {timeout}s"
+            )
+        time.sleep(min(delay, remaining))
+        delay = min(delay * _POLL_FACTOR, _POLL_MAX)
+
+
 def _safe_get_text(
     driver: webdriver.Chrome,
-    by: By,
-    selector: str,
+    locator: Tuple[str, str],
     timeout: int = 10,
     field_name: str = "",
 ) -> Optional[str]:
     """
-    Safely get text content from an element using WebDriverWait.
+    Safely get text content from an element, waiting for it to appear.
 
     Args:
         driver: Selenium WebDriver instance.
-        by: Locator strategy (e.g. By.CSS_SELECTOR).
-        selector: Locator string.
+        locator: (strategy, selector) pair, e.g. (By.CSS_SELECTOR, "...").
         timeout: Maximum wait time in seconds.
         field_name: Optional field name for logging.
 
     Returns:
         Stripped text content if found, otherwise None.
     """
+    from selenium.common.exceptions import TimeoutException
+
+    by, selector = locator
     try:
-        elem = WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located((by, selector))
-        )
-        text = elem.text.strip()
-        logger.debug(
-            "Element found for '%s' (%s='%s'): %r",
-            field_name,
-            by,
-            selector,
-            text,
-        )
-        return text or None
+        elem = _wait_for_element(driver, locator, timeout=timeout)
+        text = _normalize_text(elem.text)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Element found for '%s' (%s='%s'): %r",
+                field_name,
+                by,
+                selector,
+                text,
+            )
+        return text
     except TimeoutException:
         logger.warning(
             "Timeout while waiting for element '%s' (%s='%s')",
@@ -169,79 +520,536 @@ def _safe_get_text(
         )
         return None
 
+
+# JavaScript function mapping [css_selector, class_path] lookups to the
+# innerText of the matching element, or null when nothing matches. The
+# class path's first hit is also the selector's first match; if the path
+# finds nothing, the selector itself is run.
+_BATCH_TEXT_FN = """
+(lookups) => lookups.map(([selector, classPath]) => {
+    let elem = document;
+    for (const className of classPath) {
+        elem = elem.getElementsByClassName(className)[0];
+        if (!elem) break;
+    }
+    if (!elem || elem === document) {
+        elem = document.querySelector(selector);
+    }
+    return elem ? elem.innerText : null;
+})
+"""
+
+# Same lookup wrapped for Selenium's execute_script.
+_BATCH_TEXT_JS = f"return ({_BATCH_TEXT_FN.strip()})(arguments[0]);"
+
+
+def _scrape_all_js(driver: webdriver.Chrome) -> List[Optional[str]]:
+    """
+    Get text content for every field in FIELDS in one execute_script call.
+
+    Args:
+        driver: Selenium WebDriver instance.
+
+    Returns:
+        Text content per field (None where no element matched).
+
+    Raises:
+        WebDriverException: If the script cannot be executed.
+    """
+    values = driver.execute_script(_BATCH_TEXT_JS, _FIELD_LOOKUPS)
+    logger.debug("Batched lookup: %r", values)
+    return [_normalize_text(value) for value in values]
+
+# ---------------------------------------------------------------------------
+# Optional static HTML fast path (requests + selectolax)
+# ---------------------------------------------------------------------------
+
+_HTTP_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+# Whether the missing-dependency notice of _scrape_static was logged.
+_STATIC_UNAVAILABLE_LOGGED = False
+
+
+def _extract_from_html(html: str) -> List[Optional[str]]:
+    """
+    Parse HTML in-process and read every field in FIELDS.
+
+    This approximates the browser's innerText: <script>/<style> content
+    is dropped and whitespace is normalized, but the parser knows no
+    CSS. Text hidden by CSS is included, and adjacent elements with no
+    whitespace between them are joined without a space. For simple
+    text nodes like the FIELDS targets, both paths give the same result.
+
+    Args:
+        html: Page HTML.
+
+    Returns:
+        Text content per field (None where no element matched).
+
+    Raises:
+        ImportError: If selectolax (with its lexbor backend) is not
+            installed.
+    """
+    # The lexbor backend is available from selectolax 0.3 on; the older
+    # `selectolax.parser` module was removed in selectolax 1.0.
+    from selectolax.lexbor import LexborHTMLParser
+
+    tree = LexborHTMLParser(html)
+    tree.strip_tags(["script", "style"])
+    values = []
+    for _, selector in FIELDS:
+        node = tree.css_first(selector)
+        values.append(_normalize_text(node.text() if node else None))
+    return values
+
+
+def _scrape_static(url: str, timeout: int = 10) -> Optional[WeatherData]:
+    """
+    Try to scrape every field from the server-rendered HTML, no browser.
+
+    This is only a fast path: it returns None (and the caller falls back
+    to a browser) when `requests`/`selectolax` are not installed, the
+    request fails, or any field is missing from the static HTML.
+
+    Args:
+        url: Target weather URL.
+        timeout: HTTP request timeout in seconds.
+
+    Returns:
+        WeatherData with every field set, or None.
+    """
+    global _STATIC_UNAVAILABLE_LOGGED
+    try:
+        import requests
+        import selectolax.lexbor  # noqa: F401
+    except ImportError as e:
+        # Reported once; the default install has neither package.
+        if not _STATIC_UNAVAILABLE_LOGGED:
+            _STATIC_UNAVAILABLE_LOGGED = True
+            logger.info("Static fast path unavailable (%s); using browser", e)
+        return None
+
+    try:
+        resp = requests.get(url, headers=_HTTP_HEADERS, timeout=timeout)
+        resp.raise_for_status()
+    except requests.RequestException as e:
+        logger.warning("Static fetch failed for %s: %s", url, e)
+        return None
+
+    values = _extract_from_html(resp.text)
+    if None in values:
+        logger.debug("Static HTML incomplete for %s: %r", url, values)
+        return None
+    return WeatherData(*values)
+
 # ---------------------------------------------------------------------------
-# Core scraping logic
+# Optional CDP backend (Playwright)
 # ---------------------------------------------------------------------------
 
-def scrape_weather(
+# Shared Playwright handle and browsers keyed by headless flag.
+_PLAYWRIGHT = None
+_CDP_BROWSERS: Dict[bool, object] = {}
+
+# Playwright's sync objects only work on the thread that created them, so
+# the cdp backend is bound to the first thread that uses it. The lock
+# guards the lazy setup and the browser pool.
+_CDP_LOCK = threading.Lock()
+_CDP_THREAD: Optional[int] = None
+
+
+def _get_cdp_browser(headless: bool = True):
+    """
+    Return a pooled Playwright Chromium browser, launching it on first use.
+
+    Playwright talks to Chrome over the DevTools Protocol directly,
+    without a chromedriver process in between. A browser that crashed or
+    disconnected is replaced with a new one.
+
+    Args:
+        headless: If True, run Chromium in headless mode.
+
+    Returns:
+        A Playwright Browser instance.
+
+    Raises:
+        ImportError: If Playwright is not installed.
+        RuntimeError: If called from a thread other than the one that
+            started Playwright (the cdp backend is single-threaded).
+    """
+    global _PLAYWRIGHT, _CDP_THREAD
+    try:
+        from playwright.sync_api import sync_playwright
+    except ImportError as e:
+        raise ImportError(
+            "The 'cdp' backend requires Playwright: "
+            "pip install playwright && playwright install chromium"
+        ) from e
+
+    with _CDP_LOCK:
+        if _CDP_THREAD is not None and _CDP_THREAD != threading.get_ident():
+            raise RuntimeError(
+                "The 'cdp' backend can only be used from the thread that "
+                "first used it; use the selenium backend (or "
+                "run_crawler_many) for multi-threaded crawls"
+            )
+
+        browser = _CDP_BROWSERS.get(headless)
+        if browser is not None and not browser.is_connected():
+            logger.warning("CDP browser disconnected; relaunching")
+            del _CDP_BROWSERS[headless]
+            try:
+                browser.close()
+            except Exception as e:
+                logger.debug("Failed to close disconnected browser: %s", e)
+            browser = None
+
+        if browser is None:
+            if _PLAYWRIGHT is None:
+                _PLAYWRIGHT = sync_playwright().start()
+                _CDP_THREAD = threading.get_ident()
+            browser = _PLAYWRIGHT.chromium.launch(headless=headless)
+            _CDP_BROWSERS[headless] = browser
+            logger.info(
+                "Chromium (CDP) browser launched (headless=%s)", headless
+            )
+        return browser
+
+
+def _shutdown_cdp() -> None:
+    """Close pooled Playwright browsers and stop Playwright."""
+    global _PLAYWRIGHT, _CDP_THREAD
+    with _CDP_LOCK:
+        while _CDP_BROWSERS:
+            _, browser = _CDP_BROWSERS.popitem()
+            try:
+                browser.close()
+            except Exception as e:
+                logger.warning("Failed to close CDP browser: %s", e)
+        if _PLAYWRIGHT is not None:
+            try:
+                _PLAYWRIGHT.stop()
+            except Exception as e:
+                logger.warning("Failed to stop Playwright: %s", e)
+            _PLAYWRIGHT = None
+            _CDP_THREAD = None
+
+
+atexit.register(_shutdown_cdp)
+
+
+def _scrape_weather_cdp(
     url: str,
     headless: bool = True,
     timeout: int = 10,
-) -> WeatherData:
+) -> List[Optional[str]]:
     """
-    Scrape basic weather information from a Korean weather portal page.
-    (for example, a Naver Weather URL).
-    
+    Scrape every field in FIELDS via Playwright (Chrome DevTools Protocol).
+
     Args:
-        url: Target weather URL (e.g. a Naver Weather page).
+        url: Target weather URL.
         headless: Whether to run the browser in headless mode.
-        timeout: Maximum wait time in seconds for each element.
+        timeout: Maximum wait time in seconds.
 
     Returns:
-        WeatherData instance with scraped values.
+        Text content per field (None where no element matched).
     """
-    logger.info("Start scraping: %s", url)
-    driver = create_driver(headless=headless)
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+    browser = _get_cdp_browser(headless=headless)
+    # A fresh context per page keeps cookies isolated between runs.
+    context = browser.new_context()
+    try:
+        page = context.new_page()
+        # Timeouts are logged and the page is read anyway, matching the
+        # Selenium backend (missing fields come back as None).
+        try:
+            page.goto(
+                url, wait_until="domcontentloaded", timeout=timeout * 1000
+            )
+        except PlaywrightTimeoutError:
+            logger.warning("Timeout while loading page: %s", url)
+
+        field_name, selector = FIELDS[0]
+        try:
+            page.wait_for_selector(
+                selector, state="attached", timeout=timeout * 1000
+            )
+        except PlaywrightTimeoutError:
+            logger.warning(
+                "Timeout while waiting for element '%s' (css='%s')",
+                field_name,
+                selector,
+            )
+
+        values = page.evaluate(_BATCH_TEXT_FN, _FIELD_LOOKUPS)
+        logger.debug("Batched lookup: %r", values)
+        return [_normalize_text(value) for value in values]
+    finally:
+        context.close()
+
+# ---------------------------------------------------------------------------
+# Core scraping logic
+# ---------------------------------------------------------------------------
+
+
+def _scrape_with_driver(
+    driver: webdriver.Chrome,
+    url: str,
+    timeout: int = 10,
+    page_load_strategy: str = DEFAULT_PAGE_LOAD_STRATEGY,
+) -> List[Optional[str]]:
+    """
+    Scrape every field in FIELDS from `url` using an existing WebDriver.
+
+    Args:
+        driver: Selenium WebDriver instance.
+        url: Target weather URL.
+        timeout: Maximum wait time in seconds.
+        page_load_strategy: The strategy `driver` was created with.
+
+    Returns:
+        Text content per field (None where no element matched).
+    """
+    from selenium.common.exceptions import (
+        TimeoutException,
+        WebDriverException,
+    )
 
     try:
         driver.get(url)
 
-        # NOTE:
-        # These CSS selectors may change if the portal updates its layout.
-        # In that case, you only need to adjust the selectors below.
-        location = _safe_get_text(
-            driver,
-            By.CSS_SELECTOR,
-            "strong.location_name, span.location_name",
-            timeout=timeout,
-            field_name="location",
+        # Wait once for the page to render, then read every field in a
+        # single browser round trip.
+        locator = _FIELD_LOCATORS[0]
+        try:
+            _wait_for_element(driver, locator, timeout=timeout)
+        except TimeoutException:
+            logger.warning(
+                "Timeout while waiting for element '%s' (%s='%s')",
+                FIELDS[0][0],
+                *locator,
+            )
+
+        try:
+            return _scrape_all_js(driver)
+        except WebDriverException as e:
+            logger.warning("Batched lookup failed, falling back: %s", e)
+
+        # Fallback 1: fetch the DOM once and parse it in-process.
+        try:
+            return _extract_from_html(driver.page_source)
+        except ImportError as e:
+            logger.info("In-process HTML parsing unavailable: %s", e)
+        except WebDriverException as e:
+            logger.warning("Page source lookup failed, falling back: %s", e)
+
+        # Fallback 2: look up each element separately.
+        return [
+            _safe_get_text(
+                driver,
+                locator,
+                timeout=timeout,
+                field_name=field_name,
+            )
+            for (field_name, _), locator in zip(FIELDS, _FIELD_LOCATORS)
+        ]
+
+    finally:
+        # Keep the browser alive for reuse; only reset state between runs.
+        # With "none", also leave the page so the next run's wait cannot
+        # match its elements (see DEFAULT_PAGE_LOAD_STRATEGY).
+        try:
+            driver.delete_all_cookies()
+            if page_load_strategy == "none":
+                driver.get("about:blank")
+        except WebDriverException as e:
+            logger.warning("Failed to reset WebDriver state: %s", e)
+
+
+def _scrape_pooled(
+    url: str,
+    headless: bool = True,
+    timeout: int = 10,
+    page_load_strategy: str = DEFAULT_PAGE_LOAD_STRATEGY,
+) -> List[Optional[str]]:
+    """
+    Scrape `url` with the pooled driver, replacing it once if it is dead.
+
+    If the browser session is lost (crash, closed window, expired
+    session), the driver is evicted from the pool and the page is
+    retried once with a fresh one. Any other error is re-raised and the
+    healthy driver stays pooled.
+
+    Args:
+        url: Target weather URL.
+        headless: Whether to run the browser in headless mode.
+        timeout: Maximum wait time in seconds.
+        page_load_strategy: "normal", "eager" (default) or "none".
+
+    Returns:
+        Text content per field (None where no element matched).
+
+    Raises:
+        WebDriverException: If the page cannot be loaded, or the retry
+            with a fresh driver also fails.
+    """
+    with _POOL_LOCK:
+        driver = get_driver(
+            headless=headless, page_load_strategy=page_load_strategy
         )
-        temperature = _safe_get_text(
-            driver,
-            By.CSS_SELECTOR,
-            ".card_data_now .card_now_temperature",
-            timeout=timeout,
-            field_name="temperature",
+        try:
+            return _scrape_with_driver(
+                driver,
+                url,
+                timeout=timeout,
+                page_load_strategy=page_load_strategy,
+            )
+        except Exception as e:
+            if not _session_lost(driver, e):
+                raise
+            logger.warning("Pooled WebDriver session lost, replacing: %s", e)
+            _discard_driver(driver)
+
+        driver = get_driver(
+            headless=headless, page_load_strategy=page_load_strategy
         )
-        status = _safe_get_text(
+        return _scrape_with_driver(
             driver,
-            By.CSS_SELECTOR,
-            ".card_data_detail .card_date_emphasis",
+            url,
             timeout=timeout,
-            field_name="status",
+            page_load_strategy=page_load_strategy,
         )
 
-        data = WeatherData(
-            location=location,
-            temperature=temperature,
-            status=status,
-        )
-        logger.info("Scraping finished: %s", data.to_dict())
-        return data
 
-    finally:
-        driver.quit()
-        logger.debug("WebDriver closed")
+def _scrape_one(
+    url: str,
+    browser_scrape: Callable[[], List[Optional[str]]],
+    timeout: int = 10,
+    static_first: bool = True,
+) -> WeatherData:
+    """
+    Scrape one URL: try the static fast path, then fall back to a browser.
+
+    Args:
+        url: Target weather URL.
+        browser_scrape: Called (only if needed) to scrape `url` with a
+            browser; returns text content per field in FIELDS.
+        timeout: Maximum wait time in seconds.
+        static_first: If True, try plain HTTP + HTML parsing first.
+
+    Returns:
+        WeatherData instance with scraped values.
+    """
+    logger.info("Start scraping: %s", url)
+
+    if static_first:
+        data = _scrape_static(url, timeout=timeout)
+        if data is not None:
+            logger.info("Scraping finished (static): %s", data.to_dict())
+            return data
+
+    data = WeatherData(*browser_scrape())
+    logger.info("Scraping finished: %s", data.to_dict())
+    return data
+
+
+def scrape_weather(
+    url: str,
+    headless: bool = True,
+    timeout: int = 10,
+    backend: str = "selenium",
+    static_first: bool = True,
+    page_load_strategy: str = DEFAULT_PAGE_LOAD_STRATEGY,
+) -> WeatherData:
+    """
+    Scrape basic weather information from a Korean weather portal page.
+    (for example, a Naver Weather URL).
+    
+    Args:
+        url: Target weather URL (e.g. a Naver Weather page).
+        headless: Whether to run the browser in headless mode.
+        timeout: Maximum wait time in seconds for each element.
+        backend: "selenium" (default) or "cdp" to drive Chrome through
+            Playwright over the DevTools Protocol. The cdp backend must
+            always be used from the same thread.
+        static_first: If True, first try plain HTTP + HTML parsing and
+            only start a browser when a field is missing.
+        page_load_strategy: Selenium page load strategy: "normal",
+            "eager" (default) or "none". Ignored by the cdp backend.
+
+    Returns:
+        WeatherData instance with scraped values.
+
+    Raises:
+        ValueError: If `backend` is not a known backend name.
+    """
+    if backend not in ("selenium", "cdp"):
+        raise ValueError(f"Unknown backend: {backend!r}")
+
+    if backend == "cdp":
+        def browser_scrape() -> List[Optional[str]]:
+            return _scrape_weather_cdp(url, headless=headless, timeout=timeout)
+    else:
+        def browser_scrape() -> List[Optional[str]]:
+            return _scrape_pooled(
+                url,
+                headless=headless,
+                timeout=timeout,
+                page_load_strategy=page_load_strategy,
+            )
+
+    return _scrape_one(url, browser_scrape, timeout, static_first)
 
 # ---------------------------------------------------------------------------
 # Programmatic entry point (no argparse needed)
 # ---------------------------------------------------------------------------
 
+# Default lifetime (seconds) of run_crawler results; weather pages update
+# at most about once a minute.
+DEFAULT_CACHE_TTL = 30
+
+
+# Maximum number of cached run_crawler results.
+_RESULT_CACHE_SIZE = 128
+
+# Complete run_crawler results keyed by (call arguments..., ttl, bucket),
+# where bucket is the current TTL time slot.
+_RESULT_CACHE: Dict[tuple, WeatherData] = {}
+_RESULT_CACHE_LOCK = threading.Lock()
+
+
+def _store_result(key: tuple, data: WeatherData) -> None:
+    """
+    Cache a complete result, dropping expired and surplus entries.
+
+    Args:
+        key: Cache key ending in (ttl, bucket).
+        data: Result to cache; ignored if any field is None, so a failed
+            or partial scrape is retried on the next call.
+    """
+    if None in (data.location, data.temperature, data.status):
+        return
+
+    now = time.time()
+    with _RESULT_CACHE_LOCK:
+        for old_key in list(_RESULT_CACHE):
+            ttl, bucket = old_key[-2:]
+            if bucket != int(now // ttl):
+                del _RESULT_CACHE[old_key]
+        while len(_RESULT_CACHE) >= _RESULT_CACHE_SIZE:
+            del _RESULT_CACHE[next(iter(_RESULT_CACHE))]
+        _RESULT_CACHE[key] = data
+
+
 def run_crawler(
     url: str,
     headless: bool = True,
     timeout: int = 10,
     log_level: str = "INFO",
+    backend: str = "selenium",
+    static_first: bool = True,
+    cache_ttl: int = DEFAULT_CACHE_TTL,
+    page_load_strategy: str = DEFAULT_PAGE_LOAD_STRATEGY,
 ) -> WeatherData:
     """
     Run the crawler programmatically without relying on CLI arguments.
@@ -267,6 +1075,12 @@ def run_crawler(
         headless: Whether to run the browser in headless mode.
         timeout: Maximum wait time in seconds for each element.
         log_level: Logging level name (e.g. 'DEBUG', 'INFO').
+        backend: "selenium" (default) or "cdp" (requires Playwright).
+        static_first: Try plain HTTP before starting a browser.
+        cache_ttl: Reuse a complete result (every field set) for the
+            same arguments for up to this many seconds; 0 disables
+            caching.
+        page_load_strategy: "normal", "eager" (default) or "none".
 
     Returns:
         WeatherData instance with scraped values.
@@ -274,11 +1088,146 @@ def run_crawler(
     level = getattr(logging, log_level.upper(), logging.INFO)
     configure_logging(level=level)
 
-    return scrape_weather(
+    key = None
+    if cache_ttl > 0:
+        key = (
+            url,
+            headless,
+            timeout,
+            backend,
+            static_first,
+            page_load_strategy,
+            cache_ttl,
+            int(time.time() // cache_ttl),
+        )
+        with _RESULT_CACHE_LOCK:
+            cached = _RESULT_CACHE.get(key)
+        if cached is not None:
+            logger.debug("Using cached result for %s", url)
+            return cached
+
+    data = scrape_weather(
         url=url,
         headless=headless,
         timeout=timeout,
+        backend=backend,
+        static_first=static_first,
+        page_load_strategy=page_load_strategy,
     )
+    if key is not None:
+        _store_result(key, data)
+    return data
+
+
+def run_crawler_many(
+    urls: List[str],
+    workers: int = 4,
+    headless: bool = True,
+    timeout: int = 10,
+    log_level: str = "INFO",
+    static_first: bool = True,
+    page_load_strategy: str = DEFAULT_PAGE_LOAD_STRATEGY,
+) -> List[WeatherData]:
+    """
+    Scrape several URLs in parallel with a pool of Selenium drivers.
+
+    Up to `workers` Chrome instances are started on demand, only for URLs
+    the static fast path cannot serve; each worker thread borrows an idle
+    driver, scrapes one URL and returns the driver to the pool. A driver
+    whose session is lost is quit instead of reused. All drivers are
+    closed when the batch is finished.
+
+    A URL that cannot be scraped is logged and yields a WeatherData with
+    every field None, so the rest of the batch is still returned.
+
+    Example:
+        from korean_portal_weather_crawler import run_crawler_many
+
+        results = run_crawler_many(
+            urls=[
+                "https://weather.naver.com/today/09140104",
+                "https://weather.naver.com/today/09680101",
+            ],
+            workers=2,
+        )
+
+    Args:
+        urls: Target weather URLs.
+        workers: Number of parallel browser instances.
+        headless: Whether to run the browsers in headless mode.
+        timeout: Maximum wait time in seconds for each page.
+        log_level: Logging level name (e.g. 'DEBUG', 'INFO').
+        static_first: Try plain HTTP before using a browser for each URL.
+        page_load_strategy: "normal", "eager" (default) or "none".
+
+    Returns:
+        WeatherData instances in the same order as `urls`.
+    """
+    level = getattr(logging, log_level.upper(), logging.INFO)
+    configure_logging(level=level)
+
+    urls = list(urls)
+    if not urls:
+        return []
+
+    workers = max(1, min(workers, len(urls)))
+    idle_drivers: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+    drivers: List[webdriver.Chrome] = []
+    drivers_lock = threading.Lock()
+
+    def _scrape(url: str) -> WeatherData:
+        def browser_scrape() -> List[Optional[str]]:
+            # Browsers are started on the first URL that needs one; at
+            # most `workers` threads run, so at most `workers` drivers.
+            try:
+                driver = idle_drivers.get_nowait()
+            except queue.Empty:
+                driver = create_driver(
+                    headless=headless, page_load_strategy=page_load_strategy
+                )
+                with drivers_lock:
+                    drivers.append(driver)
+            try:
+                values = _scrape_with_driver(
+                    driver,
+                    url,
+                    timeout=timeout,
+                    page_load_strategy=page_load_strategy,
+                )
+            except Exception as e:
+                if not _session_lost(driver, e):
+                    idle_drivers.put(driver)
+                    raise
+                # Never hand a dead session to the next URL; a fresh
+                # driver is created on demand instead.
+                logger.warning("WebDriver session lost, discarding: %s", e)
+                with drivers_lock:
+                    drivers.remove(driver)
+                try:
+                    driver.quit()
+                except Exception as quit_error:
+                    logger.warning("Failed to quit WebDriver: %s", quit_error)
+                raise
+            idle_drivers.put(driver)
+            return values
+
+        # One failing URL must not discard the rest of the batch.
+        try:
+            return _scrape_one(url, browser_scrape, timeout, static_first)
+        except Exception as e:
+            logger.warning("Scraping failed for %s: %s", url, e)
+            return WeatherData(None, None, None)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(_scrape, urls))
+    finally:
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.warning("Failed to quit WebDriver: %s", e)
+        logger.debug("WebDriver workers closed")
 
 # ---------------------------------------------------------------------------
 # CLI
@@ -292,7 +1241,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument(
         "--url",
         required=True,
-        help="Target weather URL (e.g. a Naver Weather page)",
+        nargs="+",
+        help="Target weather URL(s) (e.g. a Naver Weather page)",
     )
     parser.add_argument(
         "--no-headless",
@@ -311,6 +1261,29 @@ def parse_args() -> argparse.Namespace:
         default="INFO",
         help="Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)",
     )
+    parser.add_argument(
+        "--backend",
+        choices=("selenium", "cdp"),
+        default="selenium",
+        help="Browser backend: selenium (default) or cdp (needs Playwright)",
+    )
+    parser.add_argument(
+        "--no-static",
+        action="store_true",
+        help="Skip the plain HTTP fast path and always use a browser",
+    )
+    parser.add_argument(
+        "--page-load-strategy",
+        choices=("normal", "eager", "none"),
+        default=DEFAULT_PAGE_LOAD_STRATEGY,
+        help="Selenium page load strategy (default: eager)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Parallel browsers when crawling several URLs (default: 1)",
+    )
     return parser.parse_args()
 
 
@@ -322,14 +1295,32 @@ def main() -> None:
 
     headless = not args.no_headless
 
-    data = scrape_weather(
-        url=args.url,
-        headless=headless,
-        timeout=args.timeout,
-    )
+    if len(args.url) > 1 and args.backend == "selenium":
+        results = run_crawler_many(
+            urls=args.url,
+            workers=args.workers,
+            headless=headless,
+            timeout=args.timeout,
+            log_level=args.log_level,
+            static_first=not args.no_static,
+            page_load_strategy=args.page_load_strategy,
+        )
+    else:
+        results = [
+            scrape_weather(
+                url=url,
+                headless=headless,
+                timeout=args.timeout,
+                backend=args.backend,
+                static_first=not args.no_static,
+                page_load_strategy=args.page_load_strategy,
+            )
+            for url in args.url
+        ]
 
     # Simple JSON-like output for CLI usage
-    print(data.to_dict())
+    for data in results:
+        print(data.to_dict())
 
 
 if __name__ == "__main__":
@@ -0,0 +1,288 @@
+# Offline tests: no browser or network access is needed.
+
+import copy
+import dataclasses
+import pickle
+
+import pytest
+
+import korean_portal_weather_crawler as crawler
+from korean_portal_weather_crawler import WeatherData
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    crawler._RESULT_CACHE.clear()
+    yield
+    crawler._RESULT_CACHE.clear()
+
+
+@pytest.fixture
+def fake_scrape(monkeypatch):
+    """Replace scrape_weather with a fake returning queued results."""
+    calls = []
+    results = []
+
+    def _scrape_weather(**kwargs):
+        calls.append(kwargs)
+        if results:
+            return results.pop(0)
+        return WeatherData(kwargs["url"], "20", "sunny")
+
+    monkeypatch.setattr(crawler, "scrape_weather", _scrape_weather)
+    return calls, results
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freeze time.time() at a controllable value."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(crawler.time, "time", lambda: now[0])
+    return now
+
+
+# ---------------------------------------------------------------------------
+# run_crawler result cache
+# ---------------------------------------------------------------------------
+
+def test_run_crawler_reuses_result_within_bucket(fake_scrape, clock):
+    calls, _ = fake_scrape
+    first = crawler.run_crawler("u", cache_ttl=30)
+    clock[0] += 10
+    second = crawler.run_crawler("u", cache_ttl=30)
+
+    assert second is first
+    assert len(calls) == 1
+
+
+def test_run_crawler_cache_expires_with_bucket(fake_scrape, clock):
+    calls, _ = fake_scrape
+    crawler.run_crawler("u", cache_ttl=30)
+    clock[0] += 30
+    crawler.run_crawler("u", cache_ttl=30)
+
+    assert len(calls) == 2
+
+
+def test_expired_entries_are_dropped_on_store(fake_scrape, clock):
+    crawler.run_crawler("u", cache_ttl=30)
+    clock[0] += 30
+    crawler.run_crawler("v", cache_ttl=30)
+
+    assert [key[0] for key in crawler._RESULT_CACHE] == ["v"]
+
+
+def test_incomplete_result_is_not_cached(fake_scrape, clock):
+    calls, results = fake_scrape
+    results.append(WeatherData("u", None, "sunny"))
+
+    partial = crawler.run_crawler("u", cache_ttl=30)
+    complete = crawler.run_crawler("u", cache_ttl=30)
+
+    assert partial.temperature is None
+    assert complete.temperature == "20"
+    assert len(calls) == 2
+    assert crawler.run_crawler("u", cache_ttl=30) is complete
+
+
+def test_cache_key_includes_ttl_and_arguments(fake_scrape, clock):
+    calls, _ = fake_scrape
+    crawler.run_crawler("u", cache_ttl=30)
+    crawler.run_crawler("u", cache_ttl=60)
+    crawler.run_crawler("u", cache_ttl=30, timeout=5)
+    crawler.run_crawler("u", cache_ttl=30, page_load_strategy="none")
+
+    assert len(calls) == 4
+
+
+def test_cache_ttl_zero_disables_cache(fake_scrape, clock):
+    calls, _ = fake_scrape
+    crawler.run_crawler("u", cache_ttl=0)
+    crawler.run_crawler("u", cache_ttl=0)
+
+    assert len(calls) == 2
+    assert not crawler._RESULT_CACHE
+
+
+def test_cache_evicts_oldest_entry_when_full(fake_scrape, clock, monkeypatch):
+    monkeypatch.setattr(crawler, "_RESULT_CACHE_SIZE", 2)
+    for url in ("a", "b", "c"):
+        crawler.run_crawler(url, cache_ttl=30)
+
+    assert [key[0] for key in crawler._RESULT_CACHE] == ["b", "c"]
+
+
+# ---------------------------------------------------------------------------
+# _class_path
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "selector, expected",
+    [
+        (".card_data_now .card_now_temperature",
+         ["card_data_now", "card_now_temperature"]),
+        (".card_data_detail .card_date_emphasis",
+         ["card_data_detail", "card_date_emphasis"]),
+        (".single", ["single"]),
+    ],
+)
+def test_class_path_for_descendant_class_chains(selector, expected):
+    assert crawler._class_path(selector) == expected
+
+
+@pytest.mark.parametrize(
+    "selector",
+    [
+        "strong.location_name, span.location_name",
+        ".a.b",
+        "div .a",
+        ".a > .b",
+        "#id",
+    ],
+)
+def test_class_path_rejects_other_selectors(selector):
+    assert crawler._class_path(selector) == []
+
+
+# ---------------------------------------------------------------------------
+# WeatherData
+# ---------------------------------------------------------------------------
+
+def test_weather_data_is_frozen_and_slotted():
+    data = WeatherData("Seoul", "20", "sunny")
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        data.temperature = "21"
+    assert not hasattr(data, "__dict__")
+    assert data.to_dict() == {
+        "location": "Seoul", "temperature": "20", "status": "sunny",
+    }
+
+
+@pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy])
+def test_weather_data_copy(clone):
+    data = WeatherData("Seoul", None, "sunny")
+    assert clone(data) == data
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_weather_data_pickle_round_trip(protocol):
+    data = WeatherData("Seoul", "20", None)
+    assert pickle.loads(pickle.dumps(data, protocol)) == data
+
+
+# ---------------------------------------------------------------------------
+# run_crawler_many
+# ---------------------------------------------------------------------------
+
+class FakeDriver:
+    def __init__(self):
+        self.dead = False
+        self.quit_calls = 0
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+@pytest.fixture
+def fake_browser(monkeypatch):
+    """Replace driver creation and browser scraping with fakes."""
+    created = []
+    visited = []
+
+    def _create_driver(**kwargs):
+        driver = FakeDriver()
+        created.append(driver)
+        return driver
+
+    def _scrape_with_driver(driver, url, **kwargs):
+        visited.append((driver, url))
+        if url == "dead":
+            driver.dead = True
+            raise RuntimeError("session gone")
+        if url == "bad":
+            raise RuntimeError("page failed")
+        return [url, "20", "sunny"]
+
+    monkeypatch.setattr(crawler, "create_driver", _create_driver)
+    monkeypatch.setattr(crawler, "_scrape_with_driver", _scrape_with_driver)
+    monkeypatch.setattr(
+        crawler, "_session_lost", lambda driver, error: driver.dead
+    )
+    monkeypatch.setattr(crawler, "_scrape_static", lambda url, timeout: None)
+    return created, visited
+
+
+def test_run_crawler_many_isolates_failed_urls(fake_browser):
+    results = crawler.run_crawler_many(["a", "bad", "b"], workers=1)
+
+    assert results == [
+        WeatherData("a", "20", "sunny"),
+        WeatherData(None, None, None),
+        WeatherData("b", "20", "sunny"),
+    ]
+
+
+def test_run_crawler_many_reuses_driver_after_page_error(fake_browser):
+    created, _ = fake_browser
+    crawler.run_crawler_many(["bad", "a"], workers=1)
+
+    assert len(created) == 1
+    assert created[0].quit_calls == 1
+
+
+def test_run_crawler_many_replaces_lost_session(fake_browser):
+    created, visited = fake_browser
+    results = crawler.run_crawler_many(["dead", "a"], workers=1)
+
+    assert results[1] == WeatherData("a", "20", "sunny")
+    assert len(created) == 2
+    assert visited[1][0] is created[1]
+    assert [driver.quit_calls for driver in created] == [1, 1]
+
+
+def test_run_crawler_many_skips_browser_for_static_hits(
+    fake_browser, monkeypatch
+):
+    created, _ = fake_browser
+    monkeypatch.setattr(
+        crawler,
+        "_scrape_static",
+        lambda url, timeout: WeatherData(url, "20", "sunny"),
+    )
+    results = crawler.run_crawler_many(["a", "b"], workers=2)
+
+    assert [data.location for data in results] == ["a", "b"]
+    assert created == []
+
+
+# ---------------------------------------------------------------------------
+# Static fast path
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("  맑음 \n", "맑음"),
+        ("구름\n\t 많음", "구름 많음"),
+        (" \n ", None),
+        ("", None),
+        (None, None),
+    ],
+)
+def test_normalize_text(raw, expected):
+    assert crawler._normalize_text(raw) == expected
+
+
+def test_extract_from_html_drops_scripts_and_normalizes():
+    pytest.importorskip("selectolax.lexbor")
+    html = """
+    <strong class="location_name"> 서울 <script>x()</script></strong>
+    <div class="card_data_now">
+      <span class="card_now_temperature">
+        20°
+      </span>
+    </div>
+    """
+
+    assert crawler._extract_from_html(html) == ["서울", "20°", None]